@@ -143,8 +143,14 @@ def set_attribute(
 
     # the 'foreach_set' requires a 1D array, regardless of the shape of the attribute
     # it also requires the order to be 'c' or blender might crash!!
-    attribute.data.foreach_set(
-        TYPES[type].dname, data.reshape(-1).copy(order='c'))
+    # integer attributes are stored as 32-bit ints by blender, so smaller or larger ints
+    # (such as the int8 `sec_struct`) are converted here, which also lets 'foreach_set'
+    # copy the buffer directly rather than reading each value as a python object
+    if TYPES[type].dtype is int:
+        data = data.reshape(-1).astype(np.int32, order='C')
+    else:
+        data = data.reshape(-1).copy(order='c')
+    attribute.data.foreach_set(TYPES[type].dname, data)
 
     # The updating of data doesn't work 100% of the time (see:
     # https://projects.blender.org/blender/blender/issues/118507) so this resetting of a
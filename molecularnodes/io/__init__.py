@@ -8,5 +8,5 @@ from .parse import (
     MDAnalysisSession
 )
 from .wwpdb import fetch
-from .local import load
+from .local import load, load_many
 from .retrieve import download
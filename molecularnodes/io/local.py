@@ -1,5 +1,8 @@
 import bpy
+import os
 from pathlib import Path
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 from . import parse
 
@@ -19,14 +22,11 @@ bpy.types.Scene.MN_import_local_name = bpy.props.StringProperty(
 )
 
 
-def load(
-    file_path,
-    name="Name",
-    centre='',
-    del_solvent=True,
-    style='spheres',
-    build_assembly=False
-):
+def _parse_file(file_path, bonds=True):
+    """
+    Parse the file into a Molecule, without creating anything in the Blender scene.
+    Doesn't touch `bpy` so it is safe to call from a background thread.
+    """
     from biotite import InvalidFileError
 
     suffix = Path(file_path).suffix
@@ -42,11 +42,25 @@ def load(
     if suffix not in parser:
         raise ValueError(
             f"Unable to open local file. Format '{suffix}' not supported.")
+
     try:
-        molecule = parser[suffix](file_path)
+        molecule = parser[suffix](file_path, bonds=bonds)
     except InvalidFileError:
-        molecule = parse.cif.OldCIF(file_path)
+        molecule = parse.cif.OldCIF(file_path, bonds=bonds)
+
+    return molecule
 
+
+def load(
+    file_path,
+    name="Name",
+    centre='',
+    del_solvent=True,
+    style='spheres',
+    build_assembly=False,
+    bonds=True
+):
+    molecule = _parse_file(file_path, bonds=bonds)
     molecule.create_model(
         name=name,
         style=style,
@@ -56,6 +70,58 @@ def load(
     )
     return molecule
 
+
+def load_many(
+    file_paths,
+    names=None,
+    centre='',
+    del_solvent=True,
+    style='spheres',
+    build_assembly=False,
+    bonds=True
+):
+    """
+    Load multiple local files at once.
+
+    The files are all parsed in parallel on background threads first, and the models
+    are then created in the scene one after the other on the calling thread, as `bpy`
+    can only be used from the main thread.
+
+    Parameters
+    ----------
+    file_paths : list of str or Path
+        The files to load.
+    names : list of str, optional
+        The names for each of the models. Defaults to the name of each file.
+
+    The remaining parameters are applied to every file, the same as for `load()`.
+
+    Returns
+    -------
+    list of Molecule
+        The loaded molecules, in the same order as `file_paths`.
+    """
+    file_paths = list(file_paths)
+    if names is None:
+        names = [Path(file_path).stem for file_path in file_paths]
+    elif len(names) != len(file_paths):
+        raise ValueError(
+            f"Got {len(names)} names for {len(file_paths)} files, one name is needed for each file.")
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        molecules = list(executor.map(
+            partial(_parse_file, bonds=bonds), file_paths))
+
+    for molecule, name in zip(molecules, names):
+        molecule.create_model(
+            name=name,
+            style=style,
+            build_assembly=build_assembly,
+            centre=centre,
+            del_solvent=del_solvent
+        )
+    return molecules
+
 # operator that calls the function to import the structure from a local file
 
 
@@ -65,36 +131,85 @@ class MN_OT_Import_Protein_Local(bpy.types.Operator):
     bl_description = "Open a local structure file"
     bl_options = {"REGISTER", "UNDO"}
 
+    _timer = None
+    _future = None
+    _settings = None
+
     @classmethod
     def poll(cls, context):
         return not False
 
-    def execute(self, context):
+    def _read_settings(self, context):
         scene = context.scene
-        file_path = scene.MN_import_local_path
 
         style = scene.MN_import_style
         if not scene.MN_import_node_setup:
             style = None
 
-        centre = scene.MN_centre_type
-
-        mol = load(
-            file_path=file_path,
+        return dict(
+            file_path=scene.MN_import_local_path,
             name=scene.MN_import_local_name,
-            centre=centre,
+            centre=scene.MN_centre_type,
             del_solvent=scene.MN_import_del_solvent,
             style=style,
             build_assembly=scene.MN_import_build_assembly
         )
 
+    def _create_model(self, mol, file_path, **kwargs):
+        mol.create_model(**kwargs)
+
         # return the good news!
         bpy.context.view_layer.objects.active = mol.object
         self.report({'INFO'}, message=f"Imported '{file_path}' as {mol.name}")
         return {"FINISHED"}
 
+    def execute(self, context):
+        settings = self._read_settings(context)
+        mol = _parse_file(settings['file_path'])
+        return self._create_model(mol, **settings)
+
     def invoke(self, context, event):
-        return self.execute(context)
+        # parse the file on a background thread so the interface stays responsive while
+        # large structures are read. Everything that touches the scene still happens on
+        # the main thread, once modal() sees that the parsing has finished. The settings
+        # are read now, so changes made to them while the file is parsing don't apply
+        self._settings = self._read_settings(context)
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._future = executor.submit(_parse_file, self._settings['file_path'])
+        executor.shutdown(wait=False)
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.cancel(context)
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER' or not self._future.done():
+            return {'PASS_THROUGH'}
+
+        self._remove_timer(context)
+        try:
+            mol = self._future.result()
+        except Exception as e:
+            self.report({'ERROR'}, message=f"Failed to import: {e}")
+            return {'CANCELLED'}
+
+        return self._create_model(mol, **self._settings)
+
+    def cancel(self, context):
+        # the parsing can't be interrupted once it has started, but the result is
+        # discarded and nothing is added to the scene
+        self._future.cancel()
+        self._remove_timer(context)
+
+    def _remove_timer(self, context):
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
 
 
 def panel(layout, scene):
@@ -4,15 +4,16 @@ import warnings
 
 from .molecule import Molecule
 from .assembly import AssemblyParser
+from .pdbx import _ss_from_ranges
 
 
 class OldCIF(Molecule):
-    def __init__(self, file_path, extra_fields=None, sec_struct=True):
+    def __init__(self, file_path, extra_fields=None, sec_struct=True, bonds=True):
         super().__init__()
         self.file_path = file_path
         self.file = self._read()
         self.array = self._get_structure(
-            extra_fields=extra_fields, sec_struct=sec_struct)
+            extra_fields=extra_fields, sec_struct=sec_struct, bonds=bonds)
         self.n_atoms = self.array.array_length()
 
     def _read(self):
@@ -65,15 +66,6 @@ class OldCIF(Molecule):
         return CIFAssemblyParser(self.file).get_assemblies()
 
 
-def _ss_label_to_int(label):
-    if 'HELX' in label:
-        return 1
-    elif 'STRN' in label:
-        return 2
-    else:
-        return 3
-
-
 def _get_secondary_structure(array, file):
     """
     Get secondary structure information for the array from the file.
@@ -99,7 +91,6 @@ def _get_secondary_structure(array, file):
     KeyError
         If the 'struct_conf' category is not found in the file.
     """
-    import biotite.structure as struc
 
     # get the annotations for the struc_conf cetegory. Provides start and end
     # residues for the annotations. For most files this will only contain the
@@ -122,45 +113,10 @@ def _get_secondary_structure(array, file):
         starts = np.append(starts, sheet['beg_auth_seq_id'].astype(int))
         ends = np.append(ends, sheet['end_auth_seq_id'].astype(int))
         chains = np.append(chains, sheet['end_auth_asym_id'].astype(str))
-        id_label = np.append(id_label, np.repeat('STRN', len(sheet['id'])))
-
-    # convert the string labels to integer representations of the SS
-    # AH: 1, BS: 2, LOOP: 3
-
-    id_int = np.array([_ss_label_to_int(label) for label in id_label], int)
-
-    # create a lookup dictionary that enables lookup of secondary structure
-    # based on the chain_id and res_id values
-
-    lookup = dict()
-    for chain in np.unique(chains):
-        arrays = []
-        mask = (chain == chains)
-        start_sub = starts[mask]
-        end_sub = ends[mask]
-        id_sub = id_int[mask]
-
-        for (start, end, id) in zip(start_sub, end_sub, id_sub):
-            idx = np.arange(start, end + 1, dtype=int)
-            arr = np.zeros((len(idx), 2), dtype=int)
-            arr[:, 0] = idx
-            arr[:, 1] = 3
-            arr[:, 1] = id
-            arrays.append(arr)
-
-        lookup[chain] = dict(np.vstack(arrays).tolist())
-
-    # use the lookup dictionary to get the SS annotation based on the chain_id and res_id
-    secondary_structure = np.zeros(len(array.chain_id), int)
-    for i, (chain, res) in enumerate(zip(array.chain_id, array.res_id)):
-        try:
-            secondary_structure[i] = lookup[chain].get(res, 3)
-        except KeyError:
-            secondary_structure[i] = 0
+        dtype = np.promote_types(id_label.dtype, 'U4')
+        id_label = np.append(id_label, np.full(len(sheet['id']), 'STRN', dtype))
 
-    # assign SS to 0 where not peptide
-    secondary_structure[~struc.filter_amino_acids(array)] = 0
-    return secondary_structure
+    return _ss_from_ranges(array, starts, ends, chains, id_label)
 
 
 def _get_entity_id(array, file):
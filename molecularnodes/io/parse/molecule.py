@@ -537,10 +537,9 @@ def _create_model(array,
         return struc.filter_nucleotides(array)
 
     def att_is_peptide():
-        aa = struc.filter_amino_acids(array)
-        con_aa = struc.filter_canonical_amino_acids(array)
-
-        return aa | con_aa
+        # the canonical amino acids are a subset of the CCD amino acids, so a second
+        # pass with `struc.filter_canonical_amino_acids()` would add nothing
+        return struc.filter_amino_acids(array)
 
     def att_is_hetero():
         return array.hetero
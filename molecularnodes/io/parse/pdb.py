@@ -5,29 +5,34 @@ from .molecule import Molecule
 
 
 class PDB(Molecule):
-    def __init__(self, file_path):
+    def __init__(self, file_path, bonds=True):
         super().__init__()
         self.file_path = file_path
         self.file = self.read()
-        self.array = self._get_structure()
+        self._records = _get_records(self.file.lines)
+        self.array = self._get_structure(bonds=bonds)
         self.n_atoms = self.array.array_length()
 
     def read(self):
         from biotite.structure.io import pdb
         return pdb.PDBFile.read(self.file_path)
 
-    def _get_structure(self):
+    def _get_structure(self, bonds=True):
         from biotite.structure.io import pdb
         from biotite.structure import BadStructureError
         # TODO: implement entity ID, sec_struct for PDB files
-        array = pdb.get_structure(
+        kwargs = dict(
             pdb_file=self.file,
             extra_fields=['b_factor', 'occupancy', 'charge', 'atom_id'],
-            include_bonds=True
+            include_bonds=bonds
         )
+        if self.file.get_model_count() > 1:
+            array = _get_structure_models(**kwargs)
+        else:
+            array = pdb.get_structure(**kwargs)
 
         try:
-            sec_struct = _get_sec_struct(self.file, array)
+            sec_struct = _get_sec_struct(self._records, array)
         except BadStructureError:
             sec_struct = _comp_secondary_structure(array[0])
 
@@ -38,21 +43,128 @@ class PDB(Molecule):
         return array
 
     def _assemblies(self):
-        return PDBAssemblyParser(self.file).get_assemblies()
+        # the records have already been collected, so check for the assembly remarks up
+        # front rather than raising and catching an InvalidFileError
+        if not self._records['REMARK 300'] or not self._records['REMARK 350']:
+            return None
+        return PDBAssemblyParser(self.file, records=self._records).get_assemblies()
 
 
-def _get_sec_struct(file, array):
+def _get_structure_models(pdb_file, **kwargs):
+    """
+    Get an AtomArrayStack of all of the models in a multi-model PDB file.
+
+    Biotite parses the coordinates of every atom line of every model in a python
+    loop, which dominates the time taken to open trajectories saved as PDB files.
+    The annotations are only taken from the first model anyway, so only the first
+    model is parsed by biotite and the coordinates of all of the models are read
+    with `_read_coords()`.
+
+    If the atom lines can't be matched 1:1 onto the first model (such as when
+    altlocs have been filtered out, or the models differ in size), the whole file
+    is parsed by biotite instead.
+    """
+    import biotite.structure as struc
+    from biotite.structure.io import pdb
+
+    # number of atom lines in each of the models
+    model_sizes = np.diff(_model_bounds(pdb_file))
+    if not np.all(model_sizes == model_sizes[0]):
+        return pdb.get_structure(pdb_file=pdb_file, **kwargs)
+
+    template = pdb.get_structure(pdb_file=pdb_file, model=1, **kwargs)
+    n_atoms = template.array_length()
+    if model_sizes[0] != n_atoms:
+        return pdb.get_structure(pdb_file=pdb_file, **kwargs)
+
+    try:
+        coord = _read_coords(pdb_file)
+    except ValueError:
+        return pdb.get_structure(pdb_file=pdb_file, **kwargs)
+
+    box = template.box
+    if box is not None:
+        box = np.repeat(box[np.newaxis, ...], len(model_sizes), axis=0)
+
+    return struc.from_template(
+        template, coord.reshape(len(model_sizes), n_atoms, 3), box=box
+    )
+
+
+def _model_bounds(pdb_file):
+    # biotite has already indexed the atom and model lines when reading the file
+    return np.searchsorted(
+        pdb_file._atom_line_i,
+        np.append(pdb_file._model_start_i, len(pdb_file.lines))
+    )
+
+
+def _read_coords(pdb_file):
+    """
+    Read the coordinates from all of the ATOM / HETATM lines of a PDB file.
+
+    The fixed-width coordinate columns (31-54) of the atom lines are sliced out as
+    bytes one model at a time, and each model is converted to floats in a single
+    call rather than converting each value with `float()`.
+
+    Returns
+    -------
+    coord : np.ndarray
+        (n, 3) array of coordinates for every atom line in the file.
+    """
+    lines = pdb_file.lines
+    atom_line_i = pdb_file._atom_line_i
+    bounds = _model_bounds(pdb_file)
+
+    coord = np.empty((len(atom_line_i), 3), np.float32)
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        cols = np.array(
+            [lines[i][30:54] for i in atom_line_i[start:stop]], dtype='S24'
+        )
+        coord[start:stop] = cols.view('S8').astype(np.float32).reshape(-1, 3)
+
+    return coord
+
+
+def _get_records(lines):
+    """
+    Collect the HELIX, SHEET and REMARK 300 / 350 records of a PDB file in a single
+    pass over its lines, so the secondary structure and the assembly parsing don't
+    each have to walk the whole file again.
+
+    The REMARK lines are stored without the leading 'REMARK XXX ' columns, matching
+    `PDBFile.get_remark()`.
+    """
+    records = {
+        'HELIX': [],
+        'SHEET': [],
+        'REMARK 300': [],
+        'REMARK 350': []
+    }
+    for line in lines:
+        if line.startswith('HELIX'):
+            records['HELIX'].append(line)
+        elif line.startswith('SHEET'):
+            records['SHEET'].append(line)
+        elif line.startswith('REMARK 300'):
+            records['REMARK 300'].append(line[11:])
+        elif line.startswith('REMARK 350'):
+            records['REMARK 350'].append(line[11:])
+
+    return records
+
+
+def _get_sec_struct(records, array):
     import biotite.structure as struc
 
-    lines = np.array(file.lines)
-    lines_helix = lines[np.char.startswith(lines, 'HELIX')]
-    lines_sheet = lines[np.char.startswith(lines, 'SHEET')]
+    lines_helix = records['HELIX']
+    lines_sheet = records['SHEET']
     if (len(lines_helix) == 0 and len(lines_sheet) == 0):
         raise struc.BadStructureError(
             'No secondary structure information detected.'
         )
 
-    sec_struct = np.zeros(array.array_length(), int)
+    sec_struct = np.zeros(array.array_length(), np.int8)
 
     helix_values = (22, 25, 34, 37, 20)
     sheet_values = (23, 26, 34, 37, 22)
@@ -123,7 +235,7 @@ def _comp_secondary_structure(array):
 
     char_sse = annotate_sse(array)
     int_sse = np.array([conv_sse_char_int[char]
-                       for char in char_sse], dtype=int)
+                       for char in char_sse], dtype=np.int8)
     atom_sse = spread_residue_wise(array, int_sse)
 
     return atom_sse
@@ -132,16 +244,36 @@ def _comp_secondary_structure(array):
 class PDBAssemblyParser(AssemblyParser):
     # Implementation adapted from ``biotite.structure.io.pdb.file``
 
-    def __init__(self, pdb_file):
+    def __init__(self, pdb_file, records=None):
         self._file = pdb_file
+        if records is None:
+            records = _get_records(pdb_file.lines)
+        self._records = records
+
+    def _get_remark(self, number):
+        # the first line of a remark is always empty and is skipped, the same as
+        # `PDBFile.get_remark()`
+        remark_lines = self._records[f'REMARK {number}']
+        if len(remark_lines) == 0:
+            return None
+        return remark_lines[1:]
 
     def list_assemblies(self):
-        return self._file.list_assemblies()
+        import biotite
+        remark_lines = self._get_remark(300)
+        if remark_lines is None:
+            raise biotite.InvalidFileError(
+                "File does not contain assembly information (REMARK 300)"
+            )
+        return [
+            assembly_id.strip()
+            for assembly_id in remark_lines[0][12:].split(",")
+        ]
 
     def get_transformations(self, assembly_id):
         import biotite
         # Get lines containing transformations for assemblies
-        remark_lines = self._file.get_remark(350)
+        remark_lines = self._get_remark(350)
         if remark_lines is None:
             raise biotite.InvalidFileError(
                 "File does not contain assembly information (REMARK 350)"
@@ -59,6 +59,10 @@ class PDBX(Molecule):
         return array
 
     def _assemblies(self):
+        # most small structures have no assemblies, so check for the category up
+        # front rather than raising and catching an InvalidFileError
+        if 'pdbx_struct_assembly' not in self.file.block:
+            return None
         return CIFAssemblyParser(self.file).get_assemblies()
 
         # # in the cif / BCIF file 3x4 transformation matrices are stored in individual
@@ -156,71 +160,122 @@ class PDBX(Molecule):
         KeyError
             If the 'struct_conf' category is not found in the file.
         """
-        import biotite.structure as struc
 
         # get the annotations for the struc_conf cetegory. Provides start and end
         # residues for the annotations. For most files this will only contain the
         # alpha helices, but will sometimes contain also other secondary structure
         # information such as in AlphaFold predictions
 
-        conf = file.block.get('struct_conf')
+        # get the data block once and look the categories up on it directly
+        block = file.block
+        conf = block.get('struct_conf')
         if not conf:
             raise KeyError
-        starts = conf['beg_auth_seq_id'].as_array().astype(int)
-        ends = conf['end_auth_seq_id'].as_array().astype(int)
-        chains = conf['end_auth_asym_id'].as_array().astype(str)
-        id_label = conf['id'].as_array().astype(str)
+        starts = [conf['beg_auth_seq_id'].as_array(np.int32)]
+        ends = [conf['end_auth_seq_id'].as_array(np.int32)]
+        chains = [conf['end_auth_asym_id'].as_array(str)]
+        id_label = [conf['id'].as_array(str)]
 
         # most files will have a separate category for the beta sheets
         # this can just be appended to the other start / end / id and be processed
-        # as normalquit
-        sheet = file.block.get('struct_sheet_range')
+        # as normal
+        sheet = block.get('struct_sheet_range')
         if sheet:
-            starts = np.append(
-                starts, sheet['beg_auth_seq_id'].as_array().astype(int))
-            ends = np.append(
-                ends, sheet['end_auth_seq_id'].as_array().astype(int))
-            chains = np.append(
-                chains, sheet['end_auth_asym_id'].as_array().astype(str))
-            id_label = np.append(id_label, np.repeat('STRN', len(sheet['id'])))
-
-        # convert the string labels to integer representations of the SS
-        # AH: 1, BS: 2, LOOP: 3
-
-        id_int = np.array([_ss_label_to_int(label) for label in id_label], int)
-
-        # create a lookup dictionary that enables lookup of secondary structure
-        # based on the chain_id and res_id values
-
-        lookup = dict()
-        for chain in np.unique(chains):
-            arrays = []
-            mask = (chain == chains)
-            start_sub = starts[mask]
-            end_sub = ends[mask]
-            id_sub = id_int[mask]
-
-            for (start, end, id) in zip(start_sub, end_sub, id_sub):
-                idx = np.arange(start, end + 1, dtype=int)
-                arr = np.zeros((len(idx), 2), dtype=int)
-                arr[:, 0] = idx
-                arr[:, 1] = 3
-                arr[:, 1] = id
-                arrays.append(arr)
-
-            lookup[chain] = dict(np.vstack(arrays).tolist())
-
-        # use the lookup dictionary to get the SS annotation based on the chain_id and res_id
-        secondary_structure = np.zeros(len(array.chain_id), int)
-        for i, (chain, res) in enumerate(zip(array.chain_id, array.res_id)):
-            try:
-                secondary_structure[i] = lookup[chain].get(res, 3)
-            except KeyError:
-                secondary_structure[i] = 0
-
-        # assign SS to 0 where not peptide
-        secondary_structure[~struc.filter_amino_acids(array)] = 0
-        return secondary_structure
+            starts.append(sheet['beg_auth_seq_id'].as_array(np.int32))
+            ends.append(sheet['end_auth_seq_id'].as_array(np.int32))
+            chains.append(sheet['end_auth_asym_id'].as_array(str))
+            # match the dtype of the struct_conf labels so they don't all have to be
+            # promoted when concatenating, unless they are too short to hold 'STRN'
+            dtype = np.promote_types(id_label[0].dtype, 'U4')
+            id_label.append(np.full(len(sheet['id']), 'STRN', dtype))
+
+        starts = np.concatenate(starts)
+        ends = np.concatenate(ends)
+        chains = np.concatenate(chains)
+        id_label = np.concatenate(id_label)
+
+        return _ss_from_ranges(array, starts, ends, chains, id_label)
+
+
+def _ss_from_ranges(array, starts, ends, chains, id_label):
+    """
+    Assign secondary structure to every atom of the array, from the residue ranges of
+    the 'struct_conf' and 'struct_sheet_range' categories.
+
+    Parameters
+    ----------
+    array : AtomArray or AtomArrayStack
+        The structure to assign the secondary structure to.
+    starts, ends : np.ndarray
+        The first and last auth_seq_id of each range, inclusive.
+    chains : np.ndarray
+        The auth_asym_id of each range.
+    id_label : np.ndarray
+        The label of each range, such as 'HELX_P1' or 'STRN'.
+
+    Returns
+    -------
+    np.ndarray
+        int8 array of the secondary structure of each atom, where later ranges take
+        precedence over earlier ones.
+        - 0: Not a peptide
+        - 1: Alpha helix
+        - 2: Beta sheet
+        - 3: Loop
+    """
+    import biotite.structure as struc
+
+    # convert the string labels to integer representations of the SS
+    # AH: 1, BS: 2, LOOP: 3
+
+    id_int = np.full(len(id_label), 3, np.int8)
+    id_int[np.char.find(id_label, 'STRN') >= 0] = 2
+    id_int[np.char.find(id_label, 'HELX') >= 0] = 1
+
+    # create a lookup table of (chain, res_id, SS) for every residue that is
+    # covered by one of the ranges. Chains are stored as integer codes so the
+    # ranges never have to be split up by comparing chain names, and the lookup
+    # can be done for all atoms at once with np.searchsorted
+    chain_names, chain_codes = np.unique(chains, return_inverse=True)
+
+    # expand each range into its residues in one pass, offsetting a single
+    # np.arange by the start of the range each residue belongs to
+    lengths = np.maximum(ends - starts + 1, 0)
+    offsets = np.cumsum(lengths, dtype=np.int32) - lengths
+    table_res = np.repeat(starts - offsets, lengths) + \
+        np.arange(lengths.sum(), dtype=np.int32)
+    table_ss = np.repeat(id_int, lengths)
+    table_chain = np.repeat(chain_codes.astype(np.int32), lengths)
+
+    # combine the chain code and res_id into a single sortable integer key
+    res_all = np.concatenate((table_res, array.res_id))
+    res_min = res_all.min()
+    span = res_all.max() - res_min + 1
+    keys = table_chain.astype(np.int64) * span + (table_res - res_min)
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    values = table_ss[order]
+
+    # atoms on chains without any SS information are 0, otherwise default to loop
+    atom_chain = np.searchsorted(chain_names, array.chain_id)
+    atom_chain[atom_chain == len(chain_names)] = 0
+    in_table = chain_names[atom_chain] == array.chain_id
+    atom_keys = atom_chain * span + (array.res_id - res_min)
+
+    # SS values are only 0-3 so int8 is plenty, and 8x smaller than the default int
+    secondary_structure = np.zeros(len(array.chain_id), np.int8)
+    secondary_structure[in_table] = 3
+
+    # take the right-most match, so that later ranges override earlier ones. If every
+    # range is empty (end < start) there is nothing to match and residues stay as loop
+    if len(keys) > 0:
+        idx = np.searchsorted(keys, atom_keys, side='right') - 1
+        found = in_table & (idx >= 0) & (keys[idx] == atom_keys)
+        secondary_structure[found] = values[idx[found]]
+
+    # assign SS to 0 where not peptide
+    secondary_structure[~struc.filter_amino_acids(array)] = 0
+    return secondary_structure
 
 
 def _parse_opers(oper):
@@ -244,21 +299,12 @@ def _parse_opers(oper):
     return op_ids
 
 
-def _ss_label_to_int(label):
-    if 'HELX' in label:
-        return 1
-    elif 'STRN' in label:
-        return 2
-    else:
-        return 3
-
-
 class CIF(PDBX):
-    def __init__(self, file_path):
+    def __init__(self, file_path, bonds=True):
         super().__init__(file_path)
         # self.file_path = file_path
         # self.file = self.read(file_path)
-        self.array = self.get_structure()
+        self.array = self.get_structure(bonds=bonds)
 
     def _read(self, file_path):
         import biotite.structure.io.pdbx as pdbx
@@ -266,11 +312,11 @@ class CIF(PDBX):
 
 
 class BCIF(PDBX):
-    def __init__(self, file_path):
+    def __init__(self, file_path, bonds=True):
         super().__init__(file_path)
         # self.file_path = file_path
         # self.file = self.read(file_path)
-        self.array = self.get_structure()
+        self.array = self.get_structure(bonds=bonds)
 
     def _read(self, file_path):
         import biotite.structure.io.pdbx as pdbx
@@ -288,9 +334,10 @@ class CIFAssemblyParser:
         return list(pdbx.list_assemblies(self._file).keys())
 
     def get_transformations(self, assembly_id):
-        assembly_gen_category = self._file.block["pdbx_struct_assembly_gen"]
+        block = self._file.block
+        assembly_gen_category = block["pdbx_struct_assembly_gen"]
 
-        struct_oper_category = self._file.block["pdbx_struct_oper_list"]
+        struct_oper_category = block["pdbx_struct_oper_list"]
 
         if assembly_id not in assembly_gen_category["assembly_id"].as_array(str):
             raise KeyError(f"File has no Assembly ID '{assembly_id}'")
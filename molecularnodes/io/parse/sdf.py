@@ -2,10 +2,10 @@ from .molecule import Molecule
 
 
 class SDF(Molecule):
-    def __init__(self, file_path):
+    def __init__(self, file_path, bonds=True):
         self.file_path = file_path
         self.file = self.read(self.file_path)
-        self.array = self._get_structure()
+        self.array = self._get_structure(bonds=bonds)
         self.n_atoms = self.array.array_length()
 
     def read(self, file_path):
@@ -13,8 +13,12 @@ class SDF(Molecule):
 
         return MOLFile.read(file_path)
 
-    def _get_structure(self):
-        return self.file.get_structure()
+    def _get_structure(self, bonds=True):
+        array = self.file.get_structure()
+        # bonds are always read from the file, drop them if they aren't wanted
+        if not bonds:
+            array.bonds = None
+        return array
 
     def _assemblies(self):
         # TODO maybe look into symmetry operations for small mols
@@ -55,6 +55,20 @@ def test_get_transformations(pdb_id, format):
     check_transformations(test_transformations, atoms, ref_assembly)
 
 
+@pytest.mark.parametrize("pdb_id", ["1f2n", "5zng", "1BNA"])
+def test_pdb_records_match_remarks(pdb_id):
+    """
+    The REMARK records collected in a single pass should match the ones
+    Biotite finds when scanning the file for each remark separately.
+    """
+    pdb_file = biotite_pdb.PDBFile.read(join(DATA_DIR, f"{pdb_id}.pdb"))
+    test_parser = pdb.PDBAssemblyParser(pdb_file)
+
+    assert test_parser.list_assemblies() == pdb_file.list_assemblies()
+    for number in (300, 350):
+        assert test_parser._get_remark(number) == pdb_file.get_remark(number)
+
+
 @pytest.mark.parametrize("assembly_id", [str(i+1) for i in range(5)])
 def test_get_transformations_cif(assembly_id):
     """
@@ -140,6 +140,32 @@ def test_local_pdb(snapshot):
             )
 
 
+@pytest.mark.parametrize('ext', ['cif', 'bcif', 'pdb'])
+def test_load_without_bonds(ext):
+    mol = mn.io.load(data_dir / f'1f2n.{ext}', style='spheres', bonds=False)
+    assert len(mol.object.data.edges) == 0
+    assert len(mol.object.data.vertices) > 0
+
+
+def test_load_many():
+    files = [data_dir / f'{code}.{ext}' for code,
+             ext in itertools.product(['1f2n', '4ozs'], ['cif', 'bcif', 'pdb'])]
+    molecules = mn.io.load_many(files, style=None)
+
+    assert len(molecules) == len(files)
+    for file, mol in zip(files, molecules):
+        assert mol.name.startswith(file.stem)
+        ref = mn.io.load(file, style=None)
+        assert np.allclose(
+            mol.get_attribute('position'), ref.get_attribute('position'))
+
+
+def test_load_many_names_mismatch():
+    files = [data_dir / '1f2n.cif', data_dir / '4ozs.cif']
+    with pytest.raises(ValueError):
+        mn.io.load_many(files, names=['only_one'])
+
+
 def test_rcsb_nmr(snapshot):
     mol = mn.io.fetch('2M6Q', style='cartoon')
     assert len(mol.frames.objects) == 10
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import molecularnodes as mn
 
 from .constants import data_dir
@@ -37,3 +38,35 @@ def test_bcif_entity_ids(filepath):
     entity_ids = bcif.entity_ids
     assert entity_ids is not None
     assert entity_ids == ['CAPSID PROTEIN', 'CALCIUM ION', 'water']
+
+
+
+def test_sdf_without_bonds():
+    sdf = mn.io.parse.SDF(data_dir / 'caffeine.sdf')
+    assert sdf.array.bonds is not None
+    sdf = mn.io.parse.SDF(data_dir / 'caffeine.sdf', bonds=False)
+    assert sdf.array.bonds is None
+
+def test_pdb_multi_model(tmp_path):
+    import biotite.structure as struc
+    from biotite.structure.io import pdb
+
+    array = pdb.get_structure(pdb.PDBFile.read(data_dir / '1l58.pdb'), model=1)
+    stack = struc.stack([array, array.copy(), array.copy()])
+    stack.coord[1] += 1.5
+    stack.coord[2] -= 10.25
+    file = pdb.PDBFile()
+    file.set_structure(stack)
+    path = tmp_path / '1l58_models.pdb'
+    file.write(path)
+
+    mol = mn.io.parse.PDB(path)
+    ref = pdb.get_structure(
+        pdb.PDBFile.read(path),
+        extra_fields=['b_factor', 'occupancy', 'charge', 'atom_id'],
+        include_bonds=True
+    )
+    assert mol.array.stack_depth() == 3
+    assert np.array_equal(mol.array.coord, ref.coord)
+    assert np.array_equal(mol.array.res_id, ref.res_id)
+    assert mol.array.bonds == ref.bonds
@@ -7,9 +7,48 @@ from .utils import sample_attribute_to_string
 
 
 def test_ss_label_to_int():
+    import biotite.structure as struc
+
     examples = ['TURN_TY1_P68', 'BEND64', 'HELX_LH_PP_P9', 'STRN44']
-    assert [3, 3, 1, 2] == [
-        mn.io.parse.cif._ss_label_to_int(x) for x in examples]
+    array = struc.AtomArray(len(examples))
+    array.chain_id = np.array(['A'] * len(examples))
+    array.res_id = np.arange(len(examples))
+    array.res_name = np.array(['ALA'] * len(examples))
+
+    ss = mn.io.parse.pdbx._ss_from_ranges(
+        array, array.res_id, array.res_id, array.chain_id, np.array(examples))
+    assert [3, 3, 1, 2] == ss.tolist()
+
+
+def test_ss_from_ranges():
+    import biotite.structure as struc
+
+    array = struc.AtomArray(8)
+    array.chain_id = np.array(['A', 'A', 'A', 'A', 'B', 'B', 'C', 'A'])
+    array.res_id = np.array([-1, 1, 2, 5, 1, 2, 1, 3])
+    array.res_name = np.array(['ALA'] * 7 + ['HOH'])
+
+    starts = np.array([-2, 2, 1])
+    ends = np.array([1, 4, 1])
+    chains = np.array(['A', 'A', 'B'])
+    id_label = np.array(['HELX_P1', 'TURN_TY1_P1', 'STRN'])
+
+    ss = mn.io.parse.pdbx._ss_from_ranges(
+        array, starts, ends, chains, id_label)
+    assert ss.dtype == np.int8
+    assert ss.tolist() == [1, 1, 3, 3, 2, 3, 0, 0]
+
+    # later ranges take precedence where they overlap
+    ss = mn.io.parse.pdbx._ss_from_ranges(
+        array, np.array([1, 1]), np.array([2, 2]), np.array(['A', 'A']),
+        np.array(['HELX_P1', 'STRN']))
+    assert ss.tolist() == [3, 2, 2, 3, 0, 0, 0, 0]
+
+    # ranges that cover no residues (end < start) leave the chain as loop
+    ss = mn.io.parse.pdbx._ss_from_ranges(
+        array, np.array([5]), np.array([4]), np.array(['A']),
+        np.array(['HELX_P1']))
+    assert ss.tolist() == [3, 3, 3, 3, 0, 0, 0, 0]
 
 
 def test_get_ss_from_mmcif(snapshot):